@@ -1,16 +1,73 @@
 """
 Email utility module for sending birthday emails.
 """
+import asyncio
 import smtplib
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.header import Header
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import List, Dict
 from datetime import datetime
 
+# Optional async SMTP client; the threaded path is used when not installed
+try:
+    import aiosmtplib
+    AIOSMTPLIB_AVAILABLE = True
+except ImportError:
+    AIOSMTPLIB_AVAILABLE = False
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Transient server responses worth retrying with backoff
+_RETRYABLE_SMTP_CODES = (421, 450, 554)
+
+# Stay well under typical provider connection limits (Gmail ~15, Zoho 5-10)
+_DEFAULT_CONCURRENCY = 5
+
+# Message templates built once at import; only the recipient name is
+# formatted in per message
+
+# Plain text version
+_TEXT_TEMPLATE = """
+        Happy Birthday {name}! 🎂
+
+        Wishing you a fantastic day filled with joy, laughter, and all the things you love!
+
+        May this year bring you success, happiness, and countless memorable moments.
+
+        Warm wishes,
+        Samuel Lazar
+        """
+
+# HTML version
+_HTML_TEMPLATE = """
+        <html>
+          <head></head>
+          <body style="font-family: Arial, sans-serif; padding: 20px; background-color: #f4f4f4;">
+            <div style="max-width: 600px; margin: 0 auto; background-color: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
+              <h1 style="color: #FF6B6B; text-align: center;">🎉 Happy Birthday {name}! 🎉</h1>
+              <div style="margin: 30px 0; text-align: center;">
+                <img src="https://media4.giphy.com/media/v1.Y2lkPTc5MGI3NjExMHE3d25jdHBneXFkZ3dvNW9tOTJ0djlzcGtzc3g3NXFqMGJmYnQyaSZlcD12MV9pbnRlcm5hbF9naWZfYnlfaWQmY3Q9Zw/6WFScxN6fi95z3YVQD/giphy.gif" alt="Birthday Cake" style="max-width: 300px; border-radius: 10px;">
+              </div>
+              <p style="font-size: 16px; line-height: 1.6; color: #333;">
+                Wishing you a <strong>fantastic day</strong> filled with joy, laughter, and all the things you love!
+              </p>
+              <p style="font-size: 16px; line-height: 1.6; color: #333;">
+                May this year bring you success, happiness, and countless memorable moments. 🌟
+              </p>
+              <div style="margin-top: 30px; padding-top: 20px; border-top: 2px solid #FF6B6B; text-align: center; color: #666;">
+                <p>Warm wishes,<br><strong>Samuel Lazar</strong></p>
+              </div>
+            </div>
+          </body>
+        </html>
+        """
+
 
 class EmailSender:
     """Class for sending birthday emails."""
@@ -18,7 +75,10 @@ class EmailSender:
     def __init__(self, smtp_host: str, smtp_port: int, smtp_user: str, smtp_password: str, from_email: str):
         """
         Initialize email sender.
-        
+
+        Only stores the connection parameters; no DNS lookup, socket, or TLS
+        work happens until the first send actually needs a connection.
+
         Args:
             smtp_host: SMTP server host
             smtp_port: SMTP server port
@@ -44,46 +104,16 @@ class EmailSender:
             Email message object
         """
         message = MIMEMultipart('alternative')
-        message['Subject'] = f'🎉 Happy Birthday {name}!'
+        # Encode the non-ASCII subject explicitly so the emoji survives
+        # transport instead of relying on implicit header re-encoding
+        message['Subject'] = Header(f'🎉 Happy Birthday {name}!', 'utf-8').encode()
         message['From'] = self.from_email
         message['To'] = to_email
-        
-        # Plain text version
-        text = f"""
-        Happy Birthday {name}! 🎂
-        
-        Wishing you a fantastic day filled with joy, laughter, and all the things you love!
-        
-        May this year bring you success, happiness, and countless memorable moments.
-        
-        Warm wishes,
-        Samuel Lazar
-        """
-        
-        # HTML version
-        html = f"""
-        <html>
-          <head></head>
-          <body style="font-family: Arial, sans-serif; padding: 20px; background-color: #f4f4f4;">
-            <div style="max-width: 600px; margin: 0 auto; background-color: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
-              <h1 style="color: #FF6B6B; text-align: center;">🎉 Happy Birthday {name}! 🎉</h1>
-              <div style="margin: 30px 0; text-align: center;">
-                <img src="https://media4.giphy.com/media/v1.Y2lkPTc5MGI3NjExMHE3d25jdHBneXFkZ3dvNW9tOTJ0djlzcGtzc3g3NXFqMGJmYnQyaSZlcD12MV9pbnRlcm5hbF9naWZfYnlfaWQmY3Q9Zw/6WFScxN6fi95z3YVQD/giphy.gif" alt="Birthday Cake" style="max-width: 300px; border-radius: 10px;">
-              </div>
-              <p style="font-size: 16px; line-height: 1.6; color: #333;">
-                Wishing you a <strong>fantastic day</strong> filled with joy, laughter, and all the things you love!
-              </p>
-              <p style="font-size: 16px; line-height: 1.6; color: #333;">
-                May this year bring you success, happiness, and countless memorable moments. 🌟
-              </p>
-              <div style="margin-top: 30px; padding-top: 20px; border-top: 2px solid #FF6B6B; text-align: center; color: #666;">
-                <p>Warm wishes,<br><strong>Samuel Lazar</strong></p>
-              </div>
-            </div>
-          </body>
-        </html>
-        """
-        
+
+        # Fill the recipient name into the prebuilt templates
+        text = _TEXT_TEMPLATE.format(name=name)
+        html = _HTML_TEMPLATE.format(name=name)
+
         # Attach both versions
         part1 = MIMEText(text, 'plain')
         part2 = MIMEText(html, 'html')
@@ -119,39 +149,262 @@ class EmailSender:
             logger.error(f"Failed to send email to {message['To']}: {str(e)}")
             return False
     
-    def send_birthday_emails(self, birthday_people: List[Dict]) -> Dict[str, int]:
+    def create_birthday_emails_bulk(self, names: List[str], emails: List[str]) -> List[MIMEMultipart]:
+        """
+        Create birthday emails for many recipients in one pass.
+
+        The subject and body strings for the whole batch are produced by
+        plain comprehensions over the prebuilt templates, so per-recipient
+        work is reduced to MIME assembly.
+
+        Args:
+            names: Recipient names
+            emails: Recipient email addresses, aligned with names
+
+        Returns:
+            List of email message objects
+        """
+        subjects = [Header(f'🎉 Happy Birthday {name}!', 'utf-8').encode() for name in names]
+        texts = [_TEXT_TEMPLATE.format(name=name) for name in names]
+        htmls = [_HTML_TEMPLATE.format(name=name) for name in names]
+
+        messages = []
+        for subject, to_email, text, html in zip(subjects, emails, texts, htmls):
+            message = MIMEMultipart('alternative')
+            message['Subject'] = subject
+            message['From'] = self.from_email
+            message['To'] = to_email
+            message.attach(MIMEText(text, 'plain'))
+            message.attach(MIMEText(html, 'html'))
+            messages.append(message)
+
+        return messages
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open and authenticate a new SMTP connection."""
+        logger.info(f"Connecting to SMTP server: {self.smtp_host}:{self.smtp_port}")
+        server = smtplib.SMTP(self.smtp_host, self.smtp_port)
+        server.starttls()  # Enable TLS
+        server.login(self.smtp_user, self.smtp_password)
+        return server
+
+    def _send_with_retry(self, server: smtplib.SMTP, message: MIMEMultipart, max_attempts: int = 3) -> smtplib.SMTP:
+        """
+        Send one message, reconnecting on dropped sessions and backing off
+        on transient server responses (421/450/554).
+
+        Returns the (possibly reconnected) server so the caller keeps using it.
+        """
+        delay = 1.0
+        for attempt in range(1, max_attempts + 1):
+            try:
+                server.send_message(message)
+                return server
+            except smtplib.SMTPServerDisconnected:
+                logger.warning("SMTP connection lost, reconnecting")
+                server = self._connect()
+            except smtplib.SMTPResponseException as e:
+                if e.smtp_code not in _RETRYABLE_SMTP_CODES or attempt == max_attempts:
+                    raise
+                logger.warning(f"Transient SMTP error {e.smtp_code}, retrying in {delay:.0f}s")
+                time.sleep(delay)
+                delay *= 2
+        server.send_message(message)
+        return server
+
+    def _send_batch(self, birthday_people: List[Dict]) -> Dict[str, int]:
+        """
+        Send a batch of birthday emails over a single persistent connection.
+
+        The SMTP handshake (connect, STARTTLS, login) happens once and the
+        connection is reused for every recipient in the batch.
+
+        Args:
+            birthday_people: List of dictionaries with 'name' and 'email' keys
+
+        Returns:
+            Dictionary with success and failure counts
+        """
+        results = {'success': 0, 'failed': 0}
+
+        server = None
+        try:
+            for person in birthday_people:
+                name = person.get('name', 'Friend')
+                email = person.get('email')
+
+                if not email:
+                    logger.warning(f"No email address for {name}, skipping")
+                    results['failed'] += 1
+                    continue
+
+                try:
+                    message = self.create_birthday_email(name, email)
+                    if server is None:
+                        server = self._connect()
+                    server = self._send_with_retry(server, message)
+                    logger.info(f"Successfully sent email to {email}")
+                    results['success'] += 1
+                except Exception as e:
+                    logger.error(f"Error processing email for {name}: {str(e)}")
+                    results['failed'] += 1
+        finally:
+            if server is not None:
+                try:
+                    server.quit()
+                except Exception:
+                    pass
+
+        return results
+
+    def send_birthday_emails(self, birthday_people: List[Dict], concurrency: int = None) -> Dict[str, int]:
         """
         Send birthday emails to multiple recipients.
-        
+
+        Small batches go out sequentially over one persistent connection.
+        Larger batches are split across a thread pool where each worker owns
+        its own authenticated SMTP connection, so throughput is no longer
+        bounded by a single session's round-trip latency.
+
         Args:
             birthday_people: List of dictionaries with 'name' and 'email' keys
-            
+            concurrency: Maximum parallel SMTP connections (default: capped
+                at 5 to stay within provider limits)
+
         Returns:
             Dictionary with success and failure counts
         """
         results = {'success': 0, 'failed': 0}
-        
-        logger.info(f"Preparing to send {len(birthday_people)} birthday emails")
-        
-        for person in birthday_people:
-            name = person.get('name', 'Friend')
-            email = person.get('email')
-            
-            if not email:
-                logger.warning(f"No email address for {name}, skipping")
-                results['failed'] += 1
-                continue
-            
+
+        if not birthday_people:
+            logger.info("No birthday emails to send")
+            return results
+
+        if concurrency is None:
+            concurrency = min(_DEFAULT_CONCURRENCY, len(birthday_people))
+
+        logger.info(f"Preparing to send {len(birthday_people)} birthday emails (concurrency: {concurrency})")
+
+        if concurrency <= 1 or len(birthday_people) <= 1:
+            results = self._send_batch(birthday_people)
+        else:
+            # Partition recipients into one chunk per worker; each worker
+            # opens its own connection and sends its chunk sequentially
+            chunks = [birthday_people[i::concurrency] for i in range(concurrency)]
+            chunks = [chunk for chunk in chunks if chunk]
+
+            lock = threading.Lock()
+
+            def worker(chunk):
+                batch_results = self._send_batch(chunk)
+                with lock:
+                    results['success'] += batch_results['success']
+                    results['failed'] += batch_results['failed']
+
+            with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+                list(executor.map(worker, chunks))
+
+        logger.info(f"Email sending complete. Success: {results['success']}, Failed: {results['failed']}")
+        return results
+
+    async def _send_chunk_async(self, birthday_people: List[Dict]) -> Dict[str, int]:
+        """
+        Send a chunk of birthday emails over one persistent async connection.
+
+        Connection and login failures are counted against the whole chunk
+        rather than raised, mirroring _send_batch, so the caller always gets
+        counts back instead of an exception.
+
+        Args:
+            birthday_people: List of dictionaries with 'name' and 'email' keys
+
+        Returns:
+            Dictionary with success and failure counts
+        """
+        results = {'success': 0, 'failed': 0}
+
+        server = aiosmtplib.SMTP(hostname=self.smtp_host, port=self.smtp_port, start_tls=True)
+        try:
             try:
-                message = self.create_birthday_email(name, email)
-                if self.send_email(message):
+                await server.connect()
+                await server.login(self.smtp_user, self.smtp_password)
+            except Exception as e:
+                logger.error(f"Failed to connect to SMTP server: {str(e)}")
+                results['failed'] += len(birthday_people)
+                return results
+
+            for person in birthday_people:
+                name = person.get('name', 'Friend')
+                email = person.get('email')
+
+                if not email:
+                    logger.warning(f"No email address for {name}, skipping")
+                    results['failed'] += 1
+                    continue
+
+                try:
+                    message = self.create_birthday_email(name, email)
+                    await server.send_message(message)
+                    logger.info(f"Successfully sent email to {email}")
                     results['success'] += 1
-                else:
+                except Exception as e:
+                    logger.error(f"Error processing email for {name}: {str(e)}")
                     results['failed'] += 1
-            except Exception as e:
-                logger.error(f"Error processing email for {name}: {str(e)}")
-                results['failed'] += 1
-        
+        finally:
+            # Also reached when login fails after a successful connect, so
+            # the session is always closed
+            try:
+                await server.quit()
+            except Exception:
+                pass
+
+        return results
+
+    async def send_birthday_emails_async(self, birthday_people: List[Dict], concurrency: int = None) -> Dict[str, int]:
+        """
+        Send birthday emails concurrently over a pool of async connections.
+
+        Each connection handles a chunk of recipients; the chunks run under
+        asyncio.gather so the event loop overlaps SMTP round-trips instead
+        of waiting on them serially. Requires aiosmtplib.
+
+        Args:
+            birthday_people: List of dictionaries with 'name' and 'email' keys
+            concurrency: Maximum concurrent SMTP connections (default: capped
+                at 5 to stay within provider limits)
+
+        Returns:
+            Dictionary with success and failure counts
+        """
+        results = {'success': 0, 'failed': 0}
+
+        if not birthday_people:
+            logger.info("No birthday emails to send")
+            return results
+
+        if concurrency is None:
+            concurrency = min(_DEFAULT_CONCURRENCY, len(birthday_people))
+
+        logger.info(f"Preparing to send {len(birthday_people)} birthday emails (async, concurrency: {concurrency})")
+
+        chunks = [birthday_people[i::concurrency] for i in range(concurrency)]
+        chunks = [chunk for chunk in chunks if chunk]
+
+        # return_exceptions keeps one chunk's unexpected failure from
+        # discarding the other chunks' counts (and re-running delivered
+        # emails on task retry); such a failure counts the chunk as failed
+        chunk_results = await asyncio.gather(
+            *[self._send_chunk_async(chunk) for chunk in chunks],
+            return_exceptions=True,
+        )
+        for chunk, batch_results in zip(chunks, chunk_results):
+            if isinstance(batch_results, Exception):
+                logger.error(f"Error sending email chunk: {str(batch_results)}")
+                results['failed'] += len(chunk)
+            else:
+                results['success'] += batch_results['success']
+                results['failed'] += batch_results['failed']
+
         logger.info(f"Email sending complete. Success: {results['success']}, Failed: {results['failed']}")
         return results
 
@@ -177,6 +430,12 @@ def send_birthday_emails_task(birthday_people: List[Dict],
         Results dictionary with counts
     """
     sender = EmailSender(smtp_host, smtp_port, smtp_user, smtp_password, from_email)
+
+    # Prefer the non-blocking path when aiosmtplib is installed; the worker
+    # then overlaps SMTP round-trips instead of blocking on each one
+    if AIOSMTPLIB_AVAILABLE:
+        return asyncio.run(sender.send_birthday_emails_async(birthday_people))
+
     return sender.send_birthday_emails(birthday_people)
 
 
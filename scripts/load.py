@@ -31,6 +31,30 @@ def save_to_csv(df: pd.DataFrame, file_path: str) -> None:
         raise
 
 
+def save_to_parquet(df: pd.DataFrame, file_path: str) -> None:
+    """
+    Save DataFrame to Parquet file.
+
+    Parquet is columnar and binary: writes skip CSV text formatting, reads
+    need no parsing, and dtypes survive the round-trip intact.
+
+    Args:
+        df: DataFrame to save
+        file_path: Path to save the Parquet file
+    """
+    try:
+        logger.info(f"Saving data to Parquet: {file_path}")
+
+        # Create directory if it doesn't exist
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+
+        df.to_parquet(file_path, index=False, engine='pyarrow', compression='snappy')
+        logger.info(f"Successfully saved {len(df)} records to {file_path}")
+    except Exception as e:
+        logger.error(f"Error saving to Parquet: {str(e)}")
+        raise
+
+
 def save_to_excel(df: pd.DataFrame, file_path: str) -> None:
     """
     Save DataFrame to Excel file.
@@ -52,28 +76,33 @@ def save_to_excel(df: pd.DataFrame, file_path: str) -> None:
         raise
 
 
-def load(df: pd.DataFrame, 
+def load(df: pd.DataFrame,
          csv_path: Optional[str] = None,
-         excel_path: Optional[str] = None) -> None:
+         excel_path: Optional[str] = None,
+         parquet_path: Optional[str] = None) -> None:
     """
     Main load function that saves data to specified formats.
-    
+
     Args:
         df: DataFrame to save
         csv_path: Optional path to save CSV file
         excel_path: Optional path to save Excel file
+        parquet_path: Optional path to save Parquet file
     """
     logger.info("Starting data loading")
-    
+
     if csv_path:
         save_to_csv(df, csv_path)
-    
+
     if excel_path:
         save_to_excel(df, excel_path)
-    
-    if not csv_path and not excel_path:
+
+    if parquet_path:
+        save_to_parquet(df, parquet_path)
+
+    if not csv_path and not excel_path and not parquet_path:
         logger.warning("No output paths specified. Data not saved.")
-    
+
     logger.info("Data loading complete")
 
 
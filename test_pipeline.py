@@ -0,0 +1,165 @@
+"""
+Local test script for the birthday email pipeline.
+
+Runs the extract -> transform -> load -> birthday check -> email creation
+stages without Airflow and prints a short report for each stage. No emails
+are actually sent.
+
+Usage: python test_pipeline.py
+"""
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Batches smaller than this build their emails on one thread; the work is
+# mostly GIL-bound string formatting, so fan-out only pays off once
+# per-message work (template I/O, attachments) outweighs thread overhead
+_BULK_BUILD_THRESHOLD = 100
+_BULK_BUILD_WORKERS = 4
+
+# Put the scripts directory itself on the path and import the modules flat;
+# this skips executing the scripts package __init__, which would import
+# every submodule whether the test needs it or not
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+
+from extract import extract, PYARROW_AVAILABLE
+from transform import transform
+from load import load
+from email_utils import EmailSender
+
+
+def main():
+    print("=" * 60)
+    print("BIRTHDAY EMAIL PIPELINE - LOCAL TEST")
+    print("=" * 60)
+
+    input_file = 'data/raw/birthdays.csv'
+
+    # Memoize the transform result to parquet, keyed on the source CSV's
+    # mtime, so repeated test runs skip the extract and transform stages
+    # until the data actually changes
+    source = Path(input_file)
+    cache = Path('data/processed/_cache.parquet')
+    cache_hit = (PYARROW_AVAILABLE and cache.exists() and source.exists()
+                 and cache.stat().st_mtime >= source.stat().st_mtime)
+
+    # Stage 1: Extract. No exists() precheck - that would stat the file only
+    # for the reader to open it right after; the open itself is the check
+    print("\n[1/5] Extracting data...")
+    if cache_hit:
+        df_cleaned = pd.read_parquet(cache)
+        print(f"  Cache hit: reusing {cache} ({len(df_cleaned)} records)")
+
+        # Stage 2: Transform (already cached)
+        print("\n[2/5] Transforming data...")
+        print("  Skipped: cached transform result is current")
+    else:
+        try:
+            df = extract(input_file)
+        except FileNotFoundError:
+            print(f"  ERROR: Input file not found: {input_file}")
+            return 1
+        print(f"  Extracted {len(df)} records")
+        # Join the Index directly - no intermediate list copy per print
+        print("  Columns:", ', '.join(df.columns))
+
+        # Stage 2: Transform
+        print("\n[2/5] Transforming data...")
+        df_cleaned = transform(df)
+        if PYARROW_AVAILABLE:
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            df_cleaned.to_parquet(cache, index=False)
+        print(f"  {len(df_cleaned)} records after cleaning")
+        print("  Columns:", ', '.join(df_cleaned.columns))
+
+    # transform() emits nullable Int8 month/day; no NAs survive cleaning, so
+    # collapse them to plain numpy int8 for mask-free downstream array ops
+    # (reapplied after a cache load too, since parquet may widen dtypes)
+    df_cleaned['birth_month'] = df_cleaned['birth_month'].astype(np.int8)
+    df_cleaned['birth_day'] = df_cleaned['birth_day'].astype(np.int8)
+    df_cleaned['birth_key'] = df_cleaned['birth_key'].astype(np.int16)
+
+    # Arrow-backed strings pack the column into contiguous buffers instead
+    # of one Python object per value - smaller and faster to filter
+    if PYARROW_AVAILABLE:
+        df_cleaned['name'] = df_cleaned['name'].astype('string[pyarrow]')
+        df_cleaned['email'] = df_cleaned['email'].astype('string[pyarrow]')
+
+    # Stage 3: Load. Parquet's native columnar writer skips the Python-heavy
+    # CSV text formatting; CSV stays as the no-pyarrow fallback
+    print("\n[3/5] Saving cleaned data...")
+    if PYARROW_AVAILABLE:
+        output_file = 'data/processed/test_cleaned_birthdays.parquet'
+        load(df_cleaned, parquet_path=output_file)
+    else:
+        output_file = 'data/processed/test_cleaned_birthdays.csv'
+        load(df_cleaned, csv_path=output_file)
+    print(f"  Saved to {output_file}")
+
+    # Stage 4: Birthday check
+    print("\n[4/5] Checking for today's birthdays...")
+    # date.today() is enough here - only month/day are used, so there is no
+    # point building a microsecond-precision timestamp
+    today = date.today()
+    current_month = today.month
+    current_day = today.day
+    # Single equality over the packed int16 birth_key (month*100 + day from
+    # transform). query() compiles the expression through numexpr when it's
+    # installed and the frame is large, fusing the kernel with no temporary
+    # Series; on small frames it degrades to the same single comparison
+    today_key = current_month * 100 + current_day
+    todays_birthdays = df_cleaned.query('birth_key == @today_key')
+    print(f"  Found {len(todays_birthdays)} birthday(s) today")
+
+    # Zip over the column arrays rather than iterrows, which would build a
+    # Series object per row, and emit one buffered write instead of a
+    # print (and its syscall) per recipient
+    names = todays_birthdays['name'].tolist()
+    emails = todays_birthdays['email'].tolist()
+    lines = [f"     - {name} ({email})" for name, email in zip(names, emails)]
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+    # Stage 5: Email creation (test mode, nothing is sent). The sender is
+    # only constructed when there is someone to build a message for
+    print("\n[5/5] Building birthday emails...")
+    if not names:
+        messages = []
+        print("  No birthdays today; nothing to build")
+        print("\n" + "=" * 60)
+        print("PIPELINE TEST COMPLETE")
+        print("=" * 60)
+        return 0
+
+    sender = EmailSender(
+        smtp_host=os.getenv('SMTP_HOST', 'smtp.gmail.com'),
+        smtp_port=int(os.getenv('SMTP_PORT', 587)),
+        smtp_user=os.getenv('SMTP_USER', 'your_email@gmail.com'),
+        smtp_password=os.getenv('SMTP_PASSWORD', 'your_password'),
+        from_email=os.getenv('SMTP_MAIL_FROM', 'your_email@gmail.com'),
+    )
+    if len(names) > _BULK_BUILD_THRESHOLD:
+        # Fan the bulk build out across a small thread pool, one chunk of
+        # recipients per worker
+        name_chunks = [names[i::_BULK_BUILD_WORKERS] for i in range(_BULK_BUILD_WORKERS)]
+        email_chunks = [emails[i::_BULK_BUILD_WORKERS] for i in range(_BULK_BUILD_WORKERS)]
+        with ThreadPoolExecutor(max_workers=_BULK_BUILD_WORKERS) as executor:
+            batches = executor.map(sender.create_birthday_emails_bulk, name_chunks, email_chunks)
+            messages = [message for batch in batches for message in batch]
+    else:
+        messages = sender.create_birthday_emails_bulk(names, emails)
+    print(f"  Built {len(messages)} email message(s)")
+
+    print("\n" + "=" * 60)
+    print("PIPELINE TEST COMPLETE")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())